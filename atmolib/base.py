@@ -6,14 +6,56 @@ This module comprises classes serving as foundational components
 for the various other classes and functions within the package.
 """
 
-from typing import Any
+from __future__ import annotations
+
+from typing import Any, Callable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import numpy as np
-import pandas as pd
 
 from .common import tools, constants
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Sets of valid request parameter values for constant-time
+# membership verification within the verification checks.
+_TEMPERATURE_UNITS = frozenset(constants.TEMPERATURE_UNITS)
+_PRECIPITATION_UNITS = frozenset(constants.PRECIPITATION_UNITS)
+_WIND_SPEED_UNITS = frozenset(constants.WIND_SPEED_UNITS)
+_TEMPERATURE_ALTITUDES = frozenset(constants.TEMPERATURE_ALTITUDES)
+_FREQUENCIES = frozenset(constants.FREQUENCIES)
+_CLOUD_COVER_LEVELS = frozenset(constants.CLOUD_COVER_LEVELS)
+_STATISTICAL_METRICS = frozenset(constants.DAILY_WEATHER_STATISTICAL_METRICS)
+
+# Array of weather code descriptions indexed by their corresponding weather
+# codes for looking up descriptions of weather code data in a single gather.
+_WEATHER_CODE_DESCRIPTIONS = np.empty(
+    max(constants.WEATHER_CODE_DESCRIPTIONS) + 1, dtype=np.object_
+)
+_WEATHER_CODE_DESCRIPTIONS[list(constants.WEATHER_CODE_DESCRIPTIONS)] = list(
+    constants.WEATHER_CODE_DESCRIPTIONS.values()
+)
+
+
+def is_option(value: Any, options: frozenset) -> bool:
+    """
+    Verifies whether the specified value is one of the specified options.
+    Unhashable values are never valid options and are reported as such
+    instead of raising a `TypeError` from the set membership test.
+
+    #### Params:
+    - value (Any): Value to be verified.
+    - options (frozenset): Set of valid options.
+    """
+
+    try:
+        return value in options
+
+    except TypeError:
+        return False
+
 
 class BaseMeteor:
     """Base class for all meteorology classes."""
@@ -23,11 +65,12 @@ class BaseMeteor:
     _session: requests.Session
     _api: str
 
-    __slots__ = "_lat", "_long", "_params"
+    __slots__ = ("_params",)
 
     def __init__(self, lat: int | float, long: int | float) -> None:
 
-        # 'params' dictionary to store parameters for API requests.
+        # 'params' dictionary to store parameters for API requests. It also
+        # serves as the sole storage for the coordinates of the location.
         self._params: dict[str, Any] = {}
 
         self.lat = lat
@@ -35,25 +78,25 @@ class BaseMeteor:
 
     @property
     def lat(self) -> int | float:
-        return self._lat
+        return self._params["latitude"]
 
     @lat.setter
     def lat(self, __value: int | float) -> None:
-        if __value < -90 or __value > 90:
+        if not -90 <= __value <= 90:
             raise ValueError(f"'lat' must be a number between -90 and 90.")
 
-        self._lat = self._params["latitude"] = __value
+        self._params["latitude"] = __value
 
     @property
     def long(self) -> int | float:
-        return self._long
+        return self._params["longitude"]
 
     @long.setter
     def long(self, __value: int | float) -> None:
-        if __value < -180 or __value > 180:
+        if not -180 <= __value <= 180:
             raise ValueError(f"'long' must be a number between -180 and 180.")
 
-        self._long = self._params["longitude"] = __value
+        self._params["longitude"] = __value
 
     def _get_current_data(self, params: dict[str, Any]) -> int | float:
         """
@@ -81,6 +124,35 @@ class BaseMeteor:
             self._session, self._api, params | self._params, dtype
         )
 
+    def get_many(self, calls: list[Callable[[], Any]]) -> list[Any]:
+        """
+        Concurrently executes the specified extraction calls and returns
+        their results in the same order as the calls were specified.
+
+        Each API request is I/O bound and the GIL is released while awaiting
+        the response, allowing requests with different parameters (which cannot
+        be batched into a single request) to be awaited simultaneously over the
+        connection pool of the shared request session.
+
+        #### Params:
+        - calls (list[Callable[[], Any]]): List of argument-less callables each
+        invoking a data extraction method, e.g., `lambda: obj.get_hourly_rainfall()`.
+
+        #### Example:
+        >>> weather = Weather(26.91, 75.54)
+        >>> temperature, humidity, precipitation, pressure = weather.get_many(
+        ...     [
+        ...         lambda: weather.get_hourly_temperature(unit="fahrenheit"),
+        ...         weather.get_hourly_relative_humidity,
+        ...         lambda: weather.get_hourly_precipitation(unit="inch"),
+        ...         weather.get_hourly_pressure,
+        ...     ]
+        ... )
+        """
+
+        with ThreadPoolExecutor(constants.MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(lambda call: call(), calls))
+
 
 class BaseForecast(BaseMeteor):
     """Base class for all meteorological forecast classes."""
@@ -89,7 +161,7 @@ class BaseForecast(BaseMeteor):
     # explicitly defined by child classes as per requirements.
     _max_forecast_days: int
 
-    __slots__ = "_lat", "_long", "_params", "_forecast_days"
+    __slots__ = ("_forecast_days",)
 
     def __init__(
         self, lat: int | float, long: int | float, forecast_days: int = 7
@@ -104,10 +176,21 @@ class BaseForecast(BaseMeteor):
     @forecast_days.setter
     def forecast_days(self, __value: int) -> None:
 
-        if __value not in range(1, self._max_forecast_days + 1):
+        # Maximum forecast days looked up once for the bounds check.
+        max_days: int = self._max_forecast_days
+
+        # The integrality check also accepts integral values of other numeric
+        # types such as numpy integers, unlike an `int` type check. Values not
+        # comparable with numbers raise a TypeError and are rejected as well.
+        try:
+            valid: bool = 1 <= __value <= max_days and __value == int(__value)
+
+        except TypeError:
+            valid = False
+
+        if not valid:
             raise ValueError(
-                "'forecast_days' must be an integer between 1 "
-                f"and {self._max_forecast_days}."
+                f"'forecast_days' must be an integer between 1 and {max_days}."
             )
 
         # Also updates the request parameters mapping with
@@ -116,7 +199,7 @@ class BaseForecast(BaseMeteor):
 
     def __repr__(self) -> str:
         return (
-            f"{self.__class__.__name__}(lat={self._lat}, long={self._long}, "
+            f"{self.__class__.__name__}(lat={self.lat}, long={self.long}, "
             f"forecast_days={self._forecast_days})"
         )
 
@@ -124,6 +207,8 @@ class BaseForecast(BaseMeteor):
 class BaseWeather(BaseMeteor):
     """Baseclass for all weather classes."""
 
+    __slots__ = ()
+
     @staticmethod
     def _verify_temperature_unit(unit: str) -> None:
         """
@@ -131,7 +216,7 @@ class BaseWeather(BaseMeteor):
         and raises a ValueError if found invalid.
         """
 
-        if unit not in constants.TEMPERATURE_UNITS:
+        if not is_option(unit, _TEMPERATURE_UNITS):
             raise ValueError(f"Invalid temperature unit specified: {unit!r}")
 
     @staticmethod
@@ -141,7 +226,7 @@ class BaseWeather(BaseMeteor):
         and raises a ValueError if found invalid.
         """
 
-        if unit not in constants.PRECIPITATION_UNITS:
+        if not is_option(unit, _PRECIPITATION_UNITS):
             raise ValueError(f"Invalid precipitation unit specified: {unit!r}")
 
     @staticmethod
@@ -151,7 +236,7 @@ class BaseWeather(BaseMeteor):
         and raises a ValueError if found invalid.
         """
 
-        if unit not in constants.WIND_SPEED_UNITS:
+        if not is_option(unit, _WIND_SPEED_UNITS):
             raise ValueError(f"Invalid wind speed unit specified: {unit!r}")
 
     def _verify_units(
@@ -180,7 +265,7 @@ class BaseWeather(BaseMeteor):
         """
         self._verify_temperature_unit(unit)
 
-        if altitude not in constants.TEMPERATURE_ALTITUDES:
+        if not is_option(altitude, _TEMPERATURE_ALTITUDES):
             raise ValueError(f"Invalid altitude level specified: {altitude}")
 
         return self._get_periodical_data(
@@ -234,7 +319,7 @@ class BaseWeather(BaseMeteor):
         must be `daily` or `hourly`. Defaults to `daily`.
         """
 
-        if frequency not in constants.FREQUENCIES:
+        if not is_option(frequency, _FREQUENCIES):
             raise ValueError(f"Invalid frequency specified: {frequency!r}")
 
         data: pd.Series = self._get_periodical_data(
@@ -247,9 +332,7 @@ class BaseWeather(BaseMeteor):
 
         # Creating a new column 'description' mapped to the
         # description of the corresponding weather codes.
-        dataframe["description"] = dataframe["data"].map(
-            lambda code: constants.WEATHER_CODES[str(code)]
-        )
+        dataframe["description"] = _WEATHER_CODE_DESCRIPTIONS[data.to_numpy()]
 
         return dataframe
 
@@ -265,7 +348,7 @@ class BaseWeather(BaseMeteor):
 
     def get_hourly_snowfall(self) -> pd.Series:
         """Extracts hourly snowfall data in centimeters(cm)."""
-        return self._get_periodical_data({"hourly": "rain"})
+        return self._get_periodical_data({"hourly": "snowfall"})
 
     def get_hourly_pressure(self, level: str = "surface") -> pd.Series:
         """
@@ -304,7 +387,7 @@ class BaseWeather(BaseMeteor):
             Defaults to `low`.
         """
 
-        if level not in constants.CLOUD_COVER_LEVELS:
+        if not is_option(level, _CLOUD_COVER_LEVELS):
             raise ValueError(f"Invalid altitude level specified: {level!r}")
 
         return self._get_periodical_data({"hourly": f"cloud_cover_{level}"})
@@ -357,7 +440,7 @@ class BaseWeather(BaseMeteor):
         Defaults to `celsius`.
         """
 
-        if metric not in constants.DAILY_WEATHER_STATISTICAL_METRICS:
+        if not is_option(metric, _STATISTICAL_METRICS):
             raise ValueError(f"Invalid statistical metric specified: {metric!r}")
 
         self._verify_temperature_unit(unit)
@@ -380,7 +463,7 @@ class BaseWeather(BaseMeteor):
         Defaults to `celsius`.
         """
 
-        if metric not in constants.DAILY_WEATHER_STATISTICAL_METRICS:
+        if not is_option(metric, _STATISTICAL_METRICS):
             raise ValueError(f"Invalid statistical metric specified: {metric!r}")
 
         self._verify_temperature_unit(unit)
@@ -391,7 +474,7 @@ class BaseWeather(BaseMeteor):
 
     def get_daily_max_wind_speed(self, unit: str = "kmh") -> pd.Series:
         """
-        Extracts daily maximum wind speed data at 2 meters(m) above
+        Extracts daily maximum wind speed data at 10 meters(m) above
         the ground level in the specified wind speed unit.
 
         #### Params:
@@ -404,7 +487,10 @@ class BaseWeather(BaseMeteor):
             Defaults to `kmh`.
         """
         self._verify_wind_speed_unit(unit)
-        return self._get_periodical_data({"daily": "wind_speed_10m_max"})
+
+        return self._get_periodical_data(
+            {"daily": "wind_speed_10m_max", "wind_speed_unit": unit}
+        )
 
     def get_daily_dominant_wind_direction(self) -> pd.Series:
         """
@@ -415,7 +501,7 @@ class BaseWeather(BaseMeteor):
 
     def get_daily_max_wind_gusts(self, unit: str = "kmh") -> pd.Series:
         """
-        Extracts daily maximum wind gusts at 2 meters(m) above
+        Extracts daily maximum wind gusts at 10 meters(m) above
         the ground level in the specified wind speed unit.
 
         #### Params:
@@ -428,7 +514,10 @@ class BaseWeather(BaseMeteor):
             Defaults to `kmh`.
         """
         self._verify_wind_speed_unit(unit)
-        return self._get_periodical_data({"daily": "wind_gusts_10m_max"})
+
+        return self._get_periodical_data(
+            {"daily": "wind_gusts_10m_max", "wind_speed_unit": unit}
+        )
 
     def get_daily_total_precipitation(self, unit: str = "mm") -> pd.Series:
         """
@@ -463,17 +552,17 @@ class BaseWeather(BaseMeteor):
 
     def get_daily_sunrise_time(self) -> pd.Series:
         """
-        Extracts daily sunrise time in the ISO-8601
-        datetime format (YYYY-MM-DDTHH:MM).
+        Extracts daily sunrise time parsed from the ISO-8601 datetime
+        format (YYYY-MM-DDTHH:MM) as numpy datetime64 objects.
         """
-        return self._get_periodical_data({"daily": "sunrise"}, dtype=np.object_)
+        return self._get_periodical_data({"daily": "sunrise"}, dtype="datetime64[ns]")
 
     def get_daily_sunset_time(self) -> pd.Series:
         """
-        Extracts daily sunset time in the ISO-8601
-        datetime format (YYYY-MM-DDTHH:MM).
+        Extracts daily sunset time parsed from the ISO-8601 datetime
+        format (YYYY-MM-DDTHH:MM) as numpy datetime64 objects.
         """
-        return self._get_periodical_data({"daily": "sunset"}, dtype=np.object_)
+        return self._get_periodical_data({"daily": "sunset"}, dtype="datetime64[ns]")
 
     def get_daily_daylight_duration(self) -> pd.Series:
         """Extracts daily daylight duration time in seconds(s)"""
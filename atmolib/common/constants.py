@@ -8,6 +8,7 @@ various classes and functions defined within the package.
 
 import json
 from pathlib import Path
+from datetime import date
 
 # API endpoint URLs.
 WEATHER_API = "https://api.open-meteo.com/v1/forecast"
@@ -17,6 +18,17 @@ AIR_QUALITY_API = "https://air-quality-api.open-meteo.com/v1/air-quality"
 GEOCODING_API = "https://geocoding-api.open-meteo.com/v1/search"
 ELEVATION_API = "https://api.open-meteo.com/v1/elevation"
 
+# Maximum number of API requests to be executed concurrently. Must not exceed
+# the connection pool size of `requests.Session` objects (10 by default).
+MAX_CONCURRENT_REQUESTS = 8
+
+# Maximum number of periodical API responses cached in memory, maximum number
+# of data values comprised by all the cached responses combined, and the time
+# in seconds after which cached responses are considered expired.
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_MAX_VALUES = 1_000_000
+RESPONSE_CACHE_TTL = 600
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Loads the `weather_codes.json` file comprising weather
@@ -24,6 +36,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 with open(BASE_DIR / "weather_codes.json") as file:
     WEATHER_CODES: dict[str, str] = json.load(file)
 
+# Weather codes mapped with their corresponding descriptions with integer keys
+# for vectorized description lookups over periodical weather code data.
+WEATHER_CODE_DESCRIPTIONS = {int(code): desc for code, desc in WEATHER_CODES.items()}
+
 AQI_SOURCES = "european", "us"
 
 # Maps different AQI ranges with their corresponding descriptions.
@@ -50,6 +66,9 @@ TEMPERATURE_ALTITUDES = 2, 80, 120, 180
 WIND_ALTITUDES = 10, 80, 120, 180
 ARCHIVE_WIND_ALTITUDES = 10, 100
 
+# Earliest date available for weather archive data extraction.
+ARCHIVE_START_DATE = date(1940, 1, 1)
+
 # Available atmospheric gases and plant species for
 # corresponding aerial concentration data extraction.
 GASES = "ozone", "carbon_monoxide", "nitrogen_dioxide", "sulphur_dioxide"
@@ -6,19 +6,75 @@ This module comprises utility functions designed to support
 other classes and functions defined within the package.
 """
 
-from typing import Any
+from __future__ import annotations
+
+import json
+import time
+import atexit
+import threading
+from typing import Any, TYPE_CHECKING
 from types import ModuleType
+from collections import OrderedDict
 
 import requests
 import numpy as np
-import pandas as pd
 
 from . import constants
 from ..errors import RequestError
 
+# orjson is an optional dependency used for faster parsing of the JSON API
+# responses if installed, with the standard `json` module as the fallback.
+# The raw response bytes are parsed directly, skipping the encoding detection
+# and text decoding performed by `requests.Response.json`.
+try:
+    from orjson import loads as _loads
+
+except ImportError:
+    _loads = json.loads
+
+# pandas is imported lazily within the functions requiring it to
+# reduce the import time of the package as it is a heavy dependency.
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Maps API request keys with their corresponding response timestamps, number
+# of data values and JSON responses ordered from the least to the most
+# recently used key.
+_response_cache: OrderedDict[tuple, tuple[float, int, dict[str, Any]]] = OrderedDict()
+
+# Total number of data values comprised by the cached responses.
+_cached_values: int = 0
+
+# Whether the periodical API responses are cached in memory.
+_cache_enabled: bool = True
+
+# Lock for synchronizing access to the response cache across threads.
+_cache_lock = threading.Lock()
+
+# Request session shared by the standalone elevation and geocoding
+# functions for reusing connections across consecutive API requests.
+_session = requests.Session()
+
+# Closes the request session upon exit.
+atexit.register(_session.close)
+
+
+def _encode_params(params: dict[str, Any]) -> str:
+    """
+    Assembles the query string for the specified API request parameters.
+
+    The parameter values are not percent-encoded and hence must only comprise
+    URL-safe characters, as is the case with coordinates, dates, and comma
+    separated metric names used for requesting the meteorology API endpoints.
+
+    #### Params:
+    - params (dict[str, Any]): API request parameters.
+    """
+    return "&".join(f"{key}={value}" for key, value in params.items())
+
 
 def _request_json(
-    api: str, params: dict[str, Any], session: requests.Session | None = None
+    api: str, params: dict[str, Any] | str, session: requests.Session | None = None
 ) -> dict[str, Any]:
     """
     Sends a GET request to the specified API endpoint,
@@ -26,7 +82,8 @@ def _request_json(
 
     #### Params:
     - api (str): Absolute URL of the API endpoint.
-    - params (dict[str, Any]): API request parameters.
+    - params (dict[str, Any] | str): API request parameters or a pre-assembled
+    query string comprising the same.
     - session (requests.Session | None): A `requests.Session` object for making API
     requests. If not specified, the `requests` module as the fallback.
     """
@@ -34,7 +91,7 @@ def _request_json(
     request_handler: requests.Session | ModuleType = session if session else requests
 
     with request_handler.get(api, params=params) as response:
-        results: dict[str, Any] = response.json()
+        results: dict[str, Any] = _loads(response.content)
 
         # Raises a request error if the response
         # status code does not indicate a success.
@@ -46,6 +103,108 @@ def _request_json(
     return results
 
 
+def _count_values(results: dict[str, Any]) -> int:
+    """
+    Counts the data values comprised by the arrays within
+    the sections of the specified JSON API response.
+
+    #### Params:
+    - results (dict[str, Any]): JSON API response.
+    """
+
+    return sum(
+        len(array)
+        for section in results.values()
+        if isinstance(section, dict)
+        for array in section.values()
+        if isinstance(array, list)
+    )
+
+
+def _request_cached_json(
+    api: str, params: dict[str, Any], session: requests.Session | None = None
+) -> dict[str, Any]:
+    """
+    Returns the cached JSON response for the specified API request if available
+    and not expired, or otherwise requests the API endpoint and caches the response.
+
+    #### Params:
+    - api (str): Absolute URL of the API endpoint.
+    - params (dict[str, Any]): API request parameters.
+    - session (requests.Session | None): A `requests.Session` object for making API
+    requests. If not specified, the `requests` module as the fallback.
+    """
+
+    global _cached_values
+
+    if not _cache_enabled:
+        return _request_json(api, _encode_params(params), session)
+
+    key: tuple[str, tuple] = api, tuple(sorted(params.items()))
+
+    with _cache_lock:
+        cached: tuple[float, int, dict[str, Any]] | None = _response_cache.get(key)
+
+        # Responses from the Weather History API also expire as the data
+        # for the most recent days is provisional and updated afterwards.
+        if cached and time.monotonic() - cached[0] < constants.RESPONSE_CACHE_TTL:
+            _response_cache.move_to_end(key)
+            return cached[2]
+
+    results: dict[str, Any] = _request_json(api, _encode_params(params), session)
+    count: int = _count_values(results)
+
+    # Responses larger than the cache itself are not cached.
+    if count > constants.RESPONSE_CACHE_MAX_VALUES:
+        return results
+
+    with _cache_lock:
+        if key in _response_cache:
+            _cached_values -= _response_cache.pop(key)[1]
+
+        _response_cache[key] = time.monotonic(), count, results
+        _cached_values += count
+
+        # Evicts the least recently used responses while
+        # the cache exceeds any of its size constraints.
+        while (
+            len(_response_cache) > constants.RESPONSE_CACHE_SIZE
+            or _cached_values > constants.RESPONSE_CACHE_MAX_VALUES
+        ):
+            _cached_values -= _response_cache.popitem(last=False)[1][1]
+
+    return results
+
+
+def clear_cache() -> None:
+    """Clears all the API responses cached by the package."""
+
+    global _cached_values
+
+    with _cache_lock:
+        _response_cache.clear()
+        _cached_values = 0
+
+
+def enable_cache() -> None:
+    """Enables in-memory caching of the periodical API responses (default)."""
+
+    global _cache_enabled
+    _cache_enabled = True
+
+
+def disable_cache() -> None:
+    """
+    Disables in-memory caching of the periodical API
+    responses and clears the responses cached so far.
+    """
+
+    global _cache_enabled
+    _cache_enabled = False
+
+    clear_cache()
+
+
 def _verify_keys(params: dict[str, Any], keys: tuple[str, ...]) -> None:
     """
     Looks up for the specified keys in the parameters
@@ -78,7 +237,7 @@ def get_current_data(
     """
 
     _verify_keys(params, ("latitude", "longitude", "current"))
-    results: dict[str, Any] = _request_json(api, params, session)
+    results: dict[str, Any] = _request_json(api, _encode_params(params), session)
 
     # Extracts the request current meteorology data metrics from
     # the 'results' mapping. It is mapped with the name of the requested
@@ -107,6 +266,8 @@ def get_periodical_data(
     frequency in ISO-8601 format (YYYY-MM-DDTHH:MM) or (YYYY-MM-DD).
     """
 
+    import pandas as pd
+
     _verify_keys(params, ("latitude", "longitude"))
     frequency: str
 
@@ -121,7 +282,7 @@ def get_periodical_data(
     else:
         raise KeyError("frequency parameter not found in the reuqest parameters.")
 
-    results: dict[str, Any] = _request_json(api, params, session)
+    results: dict[str, Any] = _request_cached_json(api, params, session)
 
     # Extracts meteorology data mapped with the key corresponding to the
     # name of the specified 'frequency' within the 'results' mapping.
@@ -150,8 +311,10 @@ def get_current_summary(
     the resultant pandas Series object.
     """
 
+    import pandas as pd
+
     _verify_keys(params, ("latitude", "longitude", "current"))
-    results: dict[str, Any] = _request_json(api, params, session)
+    results: dict[str, Any] = _request_json(api, _encode_params(params), session)
 
     # Extracts current meteorology data from the 'current' key in the 'results' mapping.
     data: dict[str, Any] = results["current"]
@@ -177,6 +340,8 @@ def get_periodical_summary(
     for the resultant pandas Series object.
     """
 
+    import pandas as pd
+
     _verify_keys(params, ("latitude", "longitude"))
     frequency: str
 
@@ -191,15 +356,17 @@ def get_periodical_summary(
     else:
         raise KeyError("frequency parameter not found in the request parameters.")
 
-    results: dict[str, Any] = _request_json(api, params, session)
+    results: dict[str, Any] = _request_cached_json(api, params, session)
 
     # Extracts summary data mapped with the key corresponding to the
     # name of the specified 'frequency' within the 'results' mapping.
     data: dict[str, Any] = results[frequency]
 
-    # Pops the data timeline array mapped with 'time' key within the 'data'
-    # mapping to be used as index labels in the resultant pandas DataFrame.
-    timeline: list[str] = data.pop("time")
+    # Extracts the data timeline array mapped with 'time' key within the 'data'
+    # mapping to be used as index labels in the resultant pandas DataFrame. The
+    # mapping is not altered in place as it might be shared with the cache.
+    timeline: list[str] = data["time"]
+    data = {key: value for key, value in data.items() if key != "time"}
 
     # Initializes a pandas DataFrame for the summary data and alters the
     # column labels with the specified labels within the `labels` array.
@@ -231,7 +398,9 @@ def get_elevation(lat: int | float, long: int | float) -> float:
         raise ValueError("'long' must be a number between -180 and 180.")
 
     params: dict[str, int | float] = {"latitude": lat, "longitude": long}
-    results: dict[str, Any] = _request_json(constants.ELEVATION_API, params)
+    results: dict[str, Any] = _request_json(
+        constants.ELEVATION_API, _encode_params(params), _session
+    )
 
     # Extracts and returns the elevation data from the API response mapping.
     (elevation,) = results["elevation"]
@@ -253,7 +422,7 @@ def get_city_details(name: str, count: int = 5) -> list[dict[str, Any]] | None:
         raise ValueError("'count' must be an integer between 1 and 20.")
 
     params: dict[str, str | int] = {"name": name, "count": count}
-    results: dict[str, Any] = _request_json(constants.GEOCODING_API, params)
+    results: dict[str, Any] = _request_json(constants.GEOCODING_API, params, _session)
 
     # Extracts the city details from the 'results' key in the API response
     # mapping. `None` is returned if no cities with the specified name are
@@ -1,4 +1,4 @@
-r"""
+"""
 Meteorology Package
 -------------------
 
@@ -6,14 +6,25 @@ This module defines the AirQuality class facilitating extraction
 of air quality data from Open-Meteo's Air Quality API.
 """
 
+from __future__ import annotations
+
 import atexit
+from typing import TYPE_CHECKING
 
 import requests
-import pandas as pd
 
-from ..base import BaseForecast
+from ..base import BaseForecast, is_option
 from ..common import constants, tools
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Sets of valid request parameter values for constant-time
+# membership verification within the verification checks.
+_GASES = frozenset(constants.GASES)
+_PLANTS = frozenset(constants.PLANTS)
+_AQI_SOURCES = frozenset(constants.AQI_SOURCES)
+
 
 class AirQuality(BaseForecast):
     """
@@ -23,7 +34,7 @@ class AirQuality(BaseForecast):
     hourly air quality forecast data.
     """
 
-    __slots__ = "_lat", "_long", "_forecast_days"
+    __slots__ = ()
 
     _session = requests.Session()
     _api = constants.AIR_QUALITY_API
@@ -55,7 +66,7 @@ class AirQuality(BaseForecast):
         raises a ValueError if found invalid.
         """
 
-        if gas not in constants.GASES:
+        if not is_option(gas, _GASES):
             raise ValueError(f"Invalid atmospheric gas specified: {gas!r}")
 
     @staticmethod
@@ -65,7 +76,7 @@ class AirQuality(BaseForecast):
         raises a ValueError if found invalid.
         """
 
-        if plant not in constants.PLANTS:
+        if not is_option(plant, _PLANTS):
             raise ValueError(f"Invalid plant species specified: {plant!r}")
 
     def get_current_summary(self) -> pd.Series:
@@ -137,10 +148,10 @@ class AirQuality(BaseForecast):
             Defaults to `european`.`
         """
 
-        if source not in constants.AQI_SOURCES:
+        if not is_option(source, _AQI_SOURCES):
             raise ValueError(f"Invalid AQI source specified: {source!r}")
 
-        return int(self._get_current_data({"current": "european_aqi"}))
+        return int(self._get_current_data({"current": f"{source}_aqi"}))
 
     def get_current_ammonia_conc(self) -> int | float | None:
         """
@@ -6,15 +6,22 @@ This module defines the WeatherArchive class facilitating extraction
 of historical weather data from Open-Meteo's Weather History API.
 """
 
+from __future__ import annotations
+
 import atexit
-from typing import Any
+from typing import Any, TYPE_CHECKING
 from datetime import date, datetime
 
 import requests
-import pandas as pd
 
 from ..common import constants, tools
-from ..base import BaseWeather
+from ..base import BaseWeather, is_option
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Set of valid wind altitudes for constant-time membership verification.
+_WIND_ALTITUDES = frozenset(constants.ARCHIVE_WIND_ALTITUDES)
 
 
 class WeatherArchive(BaseWeather):
@@ -25,7 +32,7 @@ class WeatherArchive(BaseWeather):
     the present.
     """
 
-    __slots__ = "_lat", "_long", "_params", "_start_date", "_end_date"
+    __slots__ = "_start_date", "_end_date"
 
     _session = requests.Session()
     _api = constants.WEATHER_ARCHIVE_API
@@ -50,7 +57,8 @@ class WeatherArchive(BaseWeather):
         - end_date (str | date | datetime): Final date for the weather data.
 
         Date parameters must be date/datetime objects or strings
-        formatted in the ISO-8601 date format (YYYY-MM-DD).
+        formatted in the ISO-8601 date format (YYYY-MM-DD), and must
+        lie between 1940-01-01 and the present day.
         """
 
         super().__init__(lat, long)
@@ -68,7 +76,7 @@ class WeatherArchive(BaseWeather):
 
     def __repr__(self) -> str:
         return (
-            f"Archive(lat={self._lat}, long={self._long},"
+            f"Archive(lat={self.lat}, long={self.long},"
             f"start_date={self._start_date}, end_date={self._end_date})"
         )
 
@@ -89,6 +97,12 @@ class WeatherArchive(BaseWeather):
         if target > date.today():
             raise ValueError(f"'{target:%Y-%m-%d}' is a date in the future.")
 
+        if target < constants.ARCHIVE_START_DATE:
+            raise ValueError(
+                f"'{target:%Y-%m-%d}' is a date prior to the earliest available "
+                f"archive date '{constants.ARCHIVE_START_DATE:%Y-%m-%d}'."
+            )
+
         return target
 
     def set_start_date(self, /, __value: str | date | datetime) -> None:
@@ -261,7 +275,7 @@ class WeatherArchive(BaseWeather):
             Defaults to `kmh`
         """
 
-        if altitude not in (10, 100):
+        if not is_option(altitude, _WIND_ALTITUDES):
             raise ValueError(f"Invalid altitude level specified: {altitude}")
 
         self._verify_wind_speed_unit(unit)
@@ -280,7 +294,7 @@ class WeatherArchive(BaseWeather):
         must be 10 or 100. Defaults to 10.
         """
 
-        if altitude not in (10, 100):
+        if not is_option(altitude, _WIND_ALTITUDES):
             raise ValueError(f"Invalid altitude level specified: {altitude}")
 
         return self._get_periodical_data({"hourly": f"wind_direction_{altitude}m"})
@@ -6,14 +6,19 @@ This module defines the MarineWeather class facilitating extraction
 of marine weather data from Open-Meteo's Marine Weather API.
 """
 
+from __future__ import annotations
+
 import atexit
+from typing import TYPE_CHECKING
 
 import requests
-import pandas as pd
 
 from ..base import BaseForecast
 from ..common import constants, tools
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class MarineWeather(BaseForecast):
     """
@@ -24,7 +29,7 @@ class MarineWeather(BaseForecast):
     resolution of 5 kilometers(km).
     """
 
-    __slots__ = "_lat", "_long", "_wave_type", "_type", "_params", "_forecast_days"
+    __slots__ = "_wave_type", "_type"
 
     _session = requests.Session()
     _api = constants.MARINE_API
@@ -83,7 +88,7 @@ class MarineWeather(BaseForecast):
 
     def __repr__(self) -> str:
         return (
-            f"MarineWeather(lat={self._lat}, long={self._long}, "
+            f"MarineWeather(lat={self.lat}, long={self.long}, "
             f"wave_type={self._wave_type!r}, forecast_days={self._forecast_days})"
         )
 
@@ -6,15 +6,30 @@ This module defines the Weather class facilitating extraction
 of weather data from Open-Meteo's Weather API.
 """
 
+from __future__ import annotations
+
 import atexit
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 import requests
 import numpy as np
-import pandas as pd
 
 from ..common import constants, tools
-from ..base import BaseForecast, BaseWeather
+from ..base import (
+    BaseForecast,
+    BaseWeather,
+    is_option,
+    _TEMPERATURE_ALTITUDES,
+    _CLOUD_COVER_LEVELS,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Sets of valid request parameter values for constant-time
+# membership verification within the verification checks.
+_WIND_ALTITUDES = frozenset(constants.WIND_ALTITUDES)
+_SOIL_TEMP_DEPTHS = frozenset(constants.SOIL_TEMP_DEPTH)
 
 
 class Weather(BaseForecast, BaseWeather):
@@ -25,7 +40,7 @@ class Weather(BaseForecast, BaseWeather):
     and daily weather forecast data.
     """
 
-    __slots__ = "_lat", "_long", "_params", "_forecast_days"
+    __slots__ = ()
 
     _api = constants.WEATHER_API
     _session = requests.Session()
@@ -57,7 +72,7 @@ class Weather(BaseForecast, BaseWeather):
         and raises a ValueError if found invalid.
         """
 
-        if altitude not in (10, 80, 120, 180):
+        if not is_option(altitude, _WIND_ALTITUDES):
             raise ValueError(f"Invalid altitude value specified: {altitude!r}")
 
     def get_current_summary(
@@ -234,7 +249,7 @@ class Weather(BaseForecast, BaseWeather):
         Defaults to `celsius`.
         """
 
-        if altitude not in constants.TEMPERATURE_ALTITUDES:
+        if not is_option(altitude, _TEMPERATURE_ALTITUDES):
             raise ValueError(f"Invalid altitude level specified: {altitude}")
 
         self._verify_temperature_unit(unit)
@@ -271,7 +286,7 @@ class Weather(BaseForecast, BaseWeather):
             - 'high' (clouds at an altitude higher than 8 km)
         """
 
-        if level not in constants.CLOUD_COVER_LEVELS:
+        if not is_option(level, _CLOUD_COVER_LEVELS):
             raise ValueError(f"Invalid altitude level specified: {level!r}")
 
         return self._get_current_data({"current": f"cloud_cover_{level}"})
@@ -479,7 +494,7 @@ class Weather(BaseForecast, BaseWeather):
         Defaults to `celsius`.
         """
 
-        if depth not in constants.SOIL_TEMP_DEPTH:
+        if not is_option(depth, _SOIL_TEMP_DEPTHS):
             raise ValueError(f"Invalid depth value specified: {depth}.")
 
         self._verify_temperature_unit(unit)
@@ -35,4 +35,5 @@ setup(
     package_data={"atmolib": ["weather_codes.json"]},
     platforms=["any"],
     install_requires=REQUIREMENTS.split("\n"),
+    extras_require={"orjson": ["orjson>=3.9"]},
 )
@@ -1,7 +1,52 @@
 import pytest
+import requests
 
+# Stash key for the cached API session installed upon `--use-requests-cache`.
+_cached_session_key = pytest.StashKey[requests.Session]()
 
-@pytest.fixture
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        help="Caches the API responses on disk using the requests-cache package.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+
+    # The API sessions of the meteorology classes and the tools module are
+    # created upon importing atmolib, which may precede this hook if a conftest
+    # importing atmolib is loaded initially, e.g. upon targeting a meteorology
+    # test module. Hence, the sessions are replaced with a cached session
+    # instead of relying upon `requests_cache.install_cache`, which only
+    # affects the sessions created afterwards.
+    if config.getoption("--use-requests-cache"):
+        import requests_cache
+        from atmolib import Weather, WeatherArchive, AirQuality, MarineWeather, tools
+
+        # The cache is stored relative to the project root directory
+        # irrespective of the directory pytest is invoked from.
+        session = requests_cache.CachedSession(
+            config.rootpath / ".cache" / "atmolib-tests",
+            backend="sqlite",
+            expire_after=43200,
+        )
+
+        for owner in (Weather, WeatherArchive, AirQuality, MarineWeather, tools):
+            owner._session = session
+
+        config.stash[_cached_session_key] = session
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    session = config.stash.get(_cached_session_key, None)
+
+    if session is not None:
+        session.close()
+
+
+@pytest.fixture(scope="session")
 def valid_coordinates() -> tuple[tuple[float, float], ...]:
     return (
         (26.91, 75.54),
@@ -11,7 +56,7 @@ def valid_coordinates() -> tuple[tuple[float, float], ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_coordinates() -> tuple[tuple[float, float], ...]:
     return (
         (-90.1, 85.4),
@@ -21,7 +66,7 @@ def invalid_coordinates() -> tuple[tuple[float, float], ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cities() -> tuple[str, ...]:
     return (
         "delhi",
@@ -32,6 +77,6 @@ def cities() -> tuple[str, ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_city_counts() -> tuple[int | float, ...]:
     return 21, 0, -1, 2.5, 20.9
@@ -3,28 +3,36 @@ from datetime import date, timedelta
 import pytest
 import atmolib
 
+# The following fixtures are shared by all the tests within a session,
+# hence the tests must not modify the attributes of the objects.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def weather() -> atmolib.Weather:
     return atmolib.Weather(0, 0, forecast_days=2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def archive() -> atmolib.WeatherArchive:
     return atmolib.WeatherArchive(0, 0, "2020-01-01", "2020-01-10")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def air_quality() -> atmolib.AirQuality:
     return atmolib.AirQuality(0, 0, forecast_days=2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", params=atmolib.constants.WAVE_TYPES)
+def marine_weather(request: pytest.FixtureRequest) -> atmolib.MarineWeather:
+    return atmolib.MarineWeather(0, 0, request.param, forecast_days=2)
+
+
+@pytest.fixture(scope="session")
 def valid_marine_coordinates() -> tuple[tuple[float, float], ...]:
     return (49.10, -39.55), (-8.30, 68.19), (-57.29, 122.78), (-44.62, -5.57)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_archive_dates() -> tuple[tuple[str, str], ...]:
     return (
         ("1940-01-01", "1940-02-01"),
@@ -34,7 +42,7 @@ def valid_archive_dates() -> tuple[tuple[str, str], ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_archive_dates() -> tuple[tuple[str, str], ...]:
     return (
         (
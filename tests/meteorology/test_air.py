@@ -27,28 +27,33 @@ class TestAirQuality:
         for days in (1, 4, 7):
             AirQuality(0, 0, forecast_days=days)
 
-    def test_object_initialization_with_invalid_parameters(
+    def test_object_initialization_with_invalid_coordinates(
         self, invalid_coordinates: tuple[tuple[float, float], ...]
     ) -> None:
         """
-        Test the `AirQuality` object initialization with invalid parameters.
+        Test the `AirQuality` object initialization with invalid coordinates.
         """
 
-        with pytest.raises(ValueError):
-
-            # Expects an ValueError upon initialization with invalid coordinates.
-            for lat, long in invalid_coordinates:
+        for lat, long in invalid_coordinates:
+            with pytest.raises(ValueError):
                 AirQuality(lat, long)
 
-            # Expects a ValueError upon initialization with invalid forecast days.
-            for days in (0, -1, 9):
-                AirQuality(0, 0, forecast_days=days)
+    @pytest.mark.parametrize("days", (0, -1, 9))
+    def test_object_initialization_with_invalid_forecast_days(self, days: int) -> None:
+        """
+        Test the `AirQuality` object initialization with invalid forecast days.
+        """
+
+        with pytest.raises(ValueError):
+            AirQuality(0, 0, forecast_days=days)
 
+    @pytest.mark.remote_data
     def test_air_quality_summary_methods(self, air_quality: AirQuality) -> None:
         """Tests the air quality summary extraction methods."""
 
-        current = air_quality.get_current_summary()
-        hourly = air_quality.get_hourly_summary()
+        current, hourly = air_quality.get_many(
+            [air_quality.get_current_summary, air_quality.get_hourly_summary]
+        )
 
         assert isinstance(current, pd.Series)
         assert isinstance(hourly, pd.DataFrame)
@@ -58,86 +63,111 @@ class TestAirQuality:
         assert current.index.tolist() == constants.CURRENT_AIR_QUALITY_SUMMARY_PARAMS
         assert hourly.columns.tolist() == constants.HOURLY_AIR_QUALITY_SUMMARY_PARAMS
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("source", constants.AQI_SOURCES)
     def test_aqi_methods(self, air_quality: AirQuality, source: str) -> None:
         """Tests the AQI extraction methods with different AQI sources."""
 
         current = air_quality.get_current_aqi(source)
 
-        # Effectively verifies that the AQI is an integer
-        # and lies within the below specified range.
-        assert current in range(0, 501)
+        assert type(current) is int
+        assert 0 <= current <= 500
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("gas", constants.GASES)
     def test_gaseous_conc_methods(self, air_quality: AirQuality, gas: str) -> None:
         """Test the gaseous concentration extraction methods."""
 
-        current = air_quality.get_current_gaseous_conc(gas)
-        hourly = air_quality.get_hourly_gaseous_conc(gas)
+        current, hourly = air_quality.get_many(
+            [
+                lambda: air_quality.get_current_gaseous_conc(gas),
+                lambda: air_quality.get_hourly_gaseous_conc(gas),
+            ]
+        )
 
         assert current >= 0
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("plant", constants.PLANTS)
     def test_pollen_conc_methods(self, air_quality: AirQuality, plant: str) -> None:
         """Tests the pollen grains concentration extraction methods."""
 
-        current = air_quality.get_current_pollen_conc(plant)
-        hourly = air_quality.get_hourly_pollen_conc(plant)
+        current, hourly = air_quality.get_many(
+            [
+                lambda: air_quality.get_current_pollen_conc(plant),
+                lambda: air_quality.get_hourly_pollen_conc(plant),
+            ]
+        )
 
         assert current is None or current >= 0
         utils.verify_positive_or_null_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_dust_conc_methods(self, air_quality: AirQuality) -> None:
         """Tests the dust concentration extraction methods."""
 
-        current = air_quality.get_current_dust_conc()
-        hourly = air_quality.get_hourly_dust_conc()
+        current, hourly = air_quality.get_many(
+            [air_quality.get_current_dust_conc, air_quality.get_hourly_dust_conc]
+        )
 
         assert current >= 0
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_ammonia_conc_methods(self, air_quality: AirQuality) -> None:
         """Tests the ammonia concentration extraction methods."""
 
-        current = air_quality.get_current_ammonia_conc()
-        hourly = air_quality.get_hourly_ammonia_conc()
+        current, hourly = air_quality.get_many(
+            [air_quality.get_current_ammonia_conc, air_quality.get_hourly_ammonia_conc]
+        )
 
         assert current is None or current >= 0
         utils.verify_positive_or_null_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_pm2_5_methods(self, air_quality: AirQuality) -> None:
         """Tests the particulate matter 2.5 extraction methods."""
 
-        current = air_quality.get_current_pm2_5_conc()
-        hourly = air_quality.get_hourly_pm10_conc()
+        current, hourly = air_quality.get_many(
+            [air_quality.get_current_pm2_5_conc, air_quality.get_hourly_pm2_5_conc]
+        )
 
         assert current >= 0
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_pm10_methods(self, air_quality: AirQuality) -> None:
         """Tests the particulate matter 10 extraction methods."""
 
-        current = air_quality.get_current_pm10_conc()
-        hourly = air_quality.get_hourly_pm10_conc()
+        current, hourly = air_quality.get_many(
+            [air_quality.get_current_pm10_conc, air_quality.get_hourly_pm10_conc]
+        )
 
         assert current >= 0
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_uv_index_methods(self, air_quality: AirQuality) -> None:
         """Tests the UV index extraction methods."""
 
-        current = air_quality.get_current_uv_index()
-        hourly = air_quality.get_hourly_uv_index()
+        current, hourly = air_quality.get_many(
+            [air_quality.get_current_uv_index, air_quality.get_hourly_uv_index]
+        )
 
         assert current >= 0
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_aerosol_optical_depth_methods(self, air_quality: AirQuality) -> None:
         """Tests the optical depth extraction methods."""
 
-        current = air_quality.get_current_aerosol_optical_depth()
-        hourly = air_quality.get_hourly_aerosol_optical_depth()
+        current, hourly = air_quality.get_many(
+            [
+                air_quality.get_current_aerosol_optical_depth,
+                air_quality.get_hourly_aerosol_optical_depth,
+            ]
+        )
 
         assert current >= 0
         utils.verify_positive_data_series(hourly)
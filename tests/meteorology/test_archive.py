@@ -3,8 +3,8 @@ Tests the classes and methods defined
 within `atmolib/meteorology/archive.py`.
 """
 
-from datetime import datetime
 from typing import Any
+from functools import partial
 
 import pytest
 import pandas as pd
@@ -42,70 +42,81 @@ class TestWeatherArchive:
         Tests the `WeatherArchive` object initialization with invalid parameters.
         """
 
-        with pytest.raises(ValueError):
-
-            # Expects a ValueError upon initialization with invalid coordinates.
-            for lat, long in invalid_coordinates:
+        # Expects a ValueError upon initialization with invalid coordinates.
+        for lat, long in invalid_coordinates:
+            with pytest.raises(ValueError):
                 WeatherArchive(
                     lat, long, start_date="2020-01-01", end_date="2020-01-10"
                 )
 
-            # Expects a ValueError upon initialization with
-            # invalid start and end date for the archive data.
-            for start, end in invalid_archive_dates:
+        # Expects a ValueError upon initialization with
+        # invalid start and end date for the archive data.
+        for start, end in invalid_archive_dates:
+            with pytest.raises(ValueError):
                 WeatherArchive(0, 0, start, end)
 
     # The following block comprises test verification methods.
 
     @staticmethod
+    def _get_summaries(
+        archive: WeatherArchive, kwargs: dict[str, Any]
+    ) -> tuple[dict[str, Any], pd.DataFrame, pd.DataFrame]:
+        """
+        Extracts the hourly and daily summaries with the specified
+        parameters, and returns them along with the parameters.
+        """
+
+        hourly = archive.get_hourly_summary(**kwargs)
+        daily = archive.get_daily_summary(**kwargs)
+
+        return kwargs, hourly, daily
+
     def _verify_summary_methods(
-        archive: WeatherArchive, params: dict[str, Any]
+        self, archive: WeatherArchive, params: tuple[dict[str, Any], ...]
     ) -> None:
-        """Verifies the summary extraction methods."""
+        """
+        Verifies the summary extraction methods with each of the specified
+        parameter mappings, requesting the summaries concurrently.
+        """
+
+        summaries = archive.get_many(
+            [partial(self._get_summaries, archive, kwargs) for kwargs in params]
+        )
 
-        hourly = archive.get_hourly_summary(**params)
-        daily = archive.get_daily_summary(**params)
+        hourly_labels = constants.HOURLY_ARCHIVE_SUMMARY_LABELS
+        daily_labels = constants.DAILY_ARCHIVE_SUMMARY_LABELS
 
-        assert isinstance(hourly, pd.DataFrame)
-        assert isinstance(daily, pd.DataFrame)
+        # The parameters are included in the assertion messages
+        # for identifying the failing unit combination.
+        for kwargs, hourly, daily in summaries:
+            assert isinstance(hourly, pd.DataFrame), kwargs
+            assert isinstance(daily, pd.DataFrame), kwargs
 
-        assert hourly.columns.tolist() == constants.HOURLY_ARCHIVE_SUMMARY_LABELS
-        assert daily.columns.tolist() == constants.DAILY_ARCHIVE_SUMMARY_LABELS
+            assert hourly.columns.tolist() == hourly_labels, kwargs
+            assert daily.columns.tolist() == daily_labels, kwargs
 
     # The following block tests summary data extraction methods.
 
-    @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
-    def test_summary_methods_with_different_temperature_units(
-        self, archive: WeatherArchive, unit: str
+    @pytest.mark.remote_data
+    def test_summary_methods_with_different_units(
+        self, archive: WeatherArchive
     ) -> None:
         """
-        Tests the summary extraction methods
-        with different temperature units.
+        Tests the summary extraction methods with different
+        temperature, precipitation and wind speed units.
         """
-        self._verify_summary_methods(archive, {"temperature_unit": unit})
 
-    @pytest.mark.parametrize("unit", constants.PRECIPITATION_UNITS)
-    def test_summary_methods_with_different_precipitation_units(
-        self, archive: WeatherArchive, unit: str
-    ) -> None:
-        """
-        Tests the summary extraction methods
-        with different precipitation units.
-        """
-        self._verify_summary_methods(archive, {"precipitation_unit": unit})
+        params = (
+            *({"temperature_unit": unit} for unit in constants.TEMPERATURE_UNITS),
+            *({"precipitation_unit": unit} for unit in constants.PRECIPITATION_UNITS),
+            *({"wind_speed_unit": unit} for unit in constants.WIND_SPEED_UNITS),
+        )
 
-    @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
-    def test_summary_methods_with_different_wind_speed_units(
-        self, archive: WeatherArchive, unit: str
-    ) -> None:
-        """
-        Tests the summary extraction methods
-        with different wind speed units.
-        """
-        self._verify_summary_methods(archive, {"wind_speed_unit": unit})
+        self._verify_summary_methods(archive, params)
 
     # The following block tests temperature data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("altitude", constants.TEMPERATURE_ALTITUDES)
     def test_temperature_methods_with_different_altitudes(
         self, archive: WeatherArchive, altitude: int
@@ -118,48 +129,39 @@ class TestWeatherArchive:
         hourly = archive.get_hourly_temperature(altitude=altitude)
         utils.verify_temperature_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
     def test_temperature_methods_with_different_units(
         self, archive: WeatherArchive, unit: str
     ) -> None:
         """
-        Tests the temperature extraction methods
-        with different temperature units.
-        """
-
-        hourly = archive.get_hourly_temperature(unit=unit)
-        daily = archive.get_daily_temperature(unit=unit)
-
-        utils.verify_temperature_data_series(hourly)
-        utils.verify_temperature_data_series(daily)
-
-    @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
-    def test_apparent_temperature_methods_with_different_units(
-        self, archive: WeatherArchive, unit: str
-    ) -> None:
-        """
-        Tests the apparent temperature extraction
-        methods with different temperature units.
-        """
-
-        hourly = archive.get_hourly_apparent_temperature(unit=unit)
-        daily = archive.get_daily_apparent_temperature(unit=unit)
-
-        utils.verify_temperature_data_series(hourly)
-        utils.verify_temperature_data_series(daily)
-
-    @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
-    def test_soil_temperature_method_with_different_units(
-        self, archive: WeatherArchive, unit: str
-    ) -> None:
-        """
-        Tests the soil temperature extraction
-        methods with different temperature units.
-        """
-
-        hourly = archive.get_hourly_soil_temperature(unit=unit)
-        utils.verify_temperature_data_series(hourly)
-
+        Tests the temperature, apparent temperature and soil temperature
+        extraction methods with different temperature units.
+        """
+
+        (
+            hourly_temp,
+            daily_temp,
+            hourly_apparent_temp,
+            daily_apparent_temp,
+            hourly_soil_temp,
+        ) = archive.get_many(
+            [
+                partial(archive.get_hourly_temperature, unit=unit),
+                partial(archive.get_daily_temperature, unit=unit),
+                partial(archive.get_hourly_apparent_temperature, unit=unit),
+                partial(archive.get_daily_apparent_temperature, unit=unit),
+                partial(archive.get_hourly_soil_temperature, unit=unit),
+            ]
+        )
+
+        utils.verify_temperature_data_series(hourly_temp)
+        utils.verify_temperature_data_series(daily_temp)
+        utils.verify_temperature_data_series(hourly_apparent_temp)
+        utils.verify_temperature_data_series(daily_apparent_temp)
+        utils.verify_temperature_data_series(hourly_soil_temp)
+
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("depth", (0, 18, 255, 157))
     def test_soil_temperature_methods_with_different_depth(
         self, archive: WeatherArchive, depth: int
@@ -172,6 +174,7 @@ class TestWeatherArchive:
         hourly = archive.get_hourly_soil_temperature(depth=depth)
         utils.verify_temperature_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("metric", constants.DAILY_WEATHER_STATISTICAL_METRICS)
     def test_daily_temperature_methods_with_different_metrics(
         self, archive: WeatherArchive, metric: str
@@ -189,6 +192,7 @@ class TestWeatherArchive:
 
     # The following block tests precipitation data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.PRECIPITATION_UNITS)
     def test_precipitation_methods_with_different_units(
         self, archive: WeatherArchive, unit: str
@@ -204,6 +208,7 @@ class TestWeatherArchive:
         utils.verify_positive_data_series(hourly)
         utils.verify_positive_data_series(daily)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.PRECIPITATION_UNITS)
     def test_rainfall_methods_with_different_units(
         self, archive: WeatherArchive, unit: str
@@ -221,6 +226,7 @@ class TestWeatherArchive:
 
     # The following block tests cloud coverage extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("level", constants.CLOUD_COVER_LEVELS)
     def test_cloud_cover_methods_with_different_levels(
         self, archive: WeatherArchive, level: str
@@ -235,97 +241,115 @@ class TestWeatherArchive:
 
     # The following block tests wind related data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
-    def test_wind_speed_methods_with_different_units(
+    def test_wind_methods_with_different_units(
         self, archive: WeatherArchive, unit: str
     ) -> None:
         """
-        Tests the wind speed extraction methods
-        with different wind speed units.
+        Tests the wind speed and wind gusts extraction
+        methods with different wind speed units.
         """
 
-        hourly = archive.get_hourly_wind_speed(unit=unit)
-        daily = archive.get_daily_max_wind_speed(unit=unit)
+        hourly_speed, daily_speed, hourly_gusts, daily_gusts = archive.get_many(
+            [
+                partial(archive.get_hourly_wind_speed, unit=unit),
+                partial(archive.get_daily_max_wind_speed, unit=unit),
+                partial(archive.get_hourly_wind_gusts, unit=unit),
+                partial(archive.get_daily_max_wind_gusts, unit=unit),
+            ]
+        )
 
-        utils.verify_positive_data_series(hourly)
-        utils.verify_positive_data_series(daily)
+        utils.verify_positive_data_series(hourly_speed)
+        utils.verify_positive_data_series(daily_speed)
+        utils.verify_positive_data_series(hourly_gusts)
+        utils.verify_positive_data_series(daily_gusts)
 
-    @pytest.mark.parametrize("altitude", constants.ARCHIVE_WIND_ALTITUDES)
+    @pytest.mark.remote_data
     def test_wind_speed_methods_with_different_altitudes(
-        self, archive: WeatherArchive, altitude: int
+        self, archive: WeatherArchive
     ) -> None:
         """
         Tests the wind speed extraction methods
         with different altitude levels.
         """
 
-        hourly = archive.get_hourly_wind_speed(altitude=altitude)
-        daily = archive.get_daily_max_wind_speed()
-
-        utils.verify_positive_data_series(hourly)
-        utils.verify_positive_data_series(daily)
-
-    @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
-    def test_wind_gusts_methods_with_different_units(
-        self, archive: WeatherArchive, unit: str
-    ) -> None:
-        """
-        Tests the wind gusts extraction methods
-        with different wind speed units.
-        """
+        *hourly, daily = archive.get_many(
+            [
+                *(
+                    partial(archive.get_hourly_wind_speed, altitude=altitude)
+                    for altitude in constants.ARCHIVE_WIND_ALTITUDES
+                ),
+                archive.get_daily_max_wind_speed,
+            ]
+        )
 
-        hourly = archive.get_hourly_wind_speed(unit=unit)
-        daily = archive.get_daily_max_wind_speed(unit=unit)
+        for altitude, series in zip(constants.ARCHIVE_WIND_ALTITUDES, hourly):
+            utils.verify_positive_data_series(series, f"altitude={altitude}")
 
-        utils.verify_positive_data_series(hourly)
         utils.verify_positive_data_series(daily)
 
-    @pytest.mark.parametrize("altitude", constants.ARCHIVE_WIND_ALTITUDES)
+    @pytest.mark.remote_data
     def test_wind_direction_methods_with_different_altitudes(
-        self, archive: WeatherArchive, altitude: int
+        self, archive: WeatherArchive
     ) -> None:
         """
         Tests the wind direction extraction methods
         with different altitude levels.
         """
 
-        hourly = archive.get_hourly_wind_direction(altitude=altitude)
-        daily = archive.get_daily_dominant_wind_direction()
+        *hourly, daily = archive.get_many(
+            [
+                *(
+                    partial(archive.get_hourly_wind_direction, altitude=altitude)
+                    for altitude in constants.ARCHIVE_WIND_ALTITUDES
+                ),
+                archive.get_daily_dominant_wind_direction,
+            ]
+        )
+
+        for altitude, series in zip(constants.ARCHIVE_WIND_ALTITUDES, hourly):
+            utils.verify_positive_range_data_series(series, 360, f"altitude={altitude}")
 
-        utils.verify_positive_range_data_series(hourly, 360)
         utils.verify_positive_range_data_series(daily, 360)
 
     # The following block tests weather code extraction methods.
 
-    @pytest.mark.parametrize("frequency", constants.FREQUENCIES)
-    def test_periodical_weather_code_method(
-        self, archive: WeatherArchive, frequency: str
-    ) -> None:
+    @pytest.mark.remote_data
+    def test_periodical_weather_code_method(self, archive: WeatherArchive) -> None:
         """
         Tests the periodical weather code extraction
         method with different data frequencies.
         """
 
-        code = archive.get_periodical_weather_code(frequency)
+        codes = archive.get_many(
+            [
+                partial(archive.get_periodical_weather_code, frequency)
+                for frequency in constants.FREQUENCIES
+            ]
+        )
 
-        # Converts the values stored in the 'data' column into strings to verify
-        # them with the keys of the `atmolib.constants.WEATHER_CODES` dictionary.
-        code["data"] = code["data"].astype(str)
+        for frequency, code in zip(constants.FREQUENCIES, codes):
+            assert isinstance(code, pd.DataFrame), frequency
 
-        assert isinstance(code, pd.DataFrame)
+            # Verifies the integer weather codes directly against the integer keys
+            # of `constants.WEATHER_CODE_DESCRIPTIONS` without any string casting.
+            data, descriptions = code["data"], code["description"]
 
-        assert code["data"].isin(constants.WEATHER_CODES).all()
-        assert code["description"].isin(constants.WEATHER_CODES.values()).all()
+            assert data.isin(constants.WEATHER_CODE_DESCRIPTIONS).all(), frequency
+            assert descriptions.isin(constants.WEATHER_CODES.values()).all(), frequency
 
     # All other types of weather data extraction
     # methods are tested in the following block.
 
+    @pytest.mark.remote_data
     def test_relative_humidity_methods(self, archive: WeatherArchive) -> None:
         """Tests the relative humidity extraction methods."""
 
         hourly = archive.get_hourly_relative_humidity()
         utils.verify_positive_range_data_series(hourly, 100)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("level", constants.PRESSURE_LEVELS)
     def test_pressure_methods_with_different_levels(
         self, archive: WeatherArchive, level: str
@@ -338,6 +362,7 @@ class TestWeatherArchive:
         hourly = archive.get_hourly_pressure(level=level)
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("depth", (0, 26, 182, 255))
     def test_soil_moisture_methods(self, archive: WeatherArchive, depth: int) -> None:
         """
@@ -347,6 +372,7 @@ class TestWeatherArchive:
         hourly = archive.get_hourly_soil_moisture(depth=depth)
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_daylight_and_sunlight_duration_methods(
         self, archive: WeatherArchive
     ) -> None:
@@ -360,6 +386,7 @@ class TestWeatherArchive:
         utils.verify_positive_range_data_series(daylight, 86_400)
         utils.verify_positive_range_data_series(sunshine, 86_400)
 
+    @pytest.mark.remote_data
     def test_sunrise_and_sunset_time_methods(self, archive: WeatherArchive) -> None:
         """
         Tests the daily sunrise and sunset time extraction methods.
@@ -368,10 +395,10 @@ class TestWeatherArchive:
         sunrise = archive.get_daily_sunrise_time()
         sunset = archive.get_daily_sunset_time()
 
-        datetime_format = r"%Y-%m-%dT%H:%M"
-
         assert isinstance(sunrise, pd.Series)
         assert isinstance(sunset, pd.Series)
 
-        for time in pd.concat([sunrise, sunset], ignore_index=True):
-            assert datetime.strptime(time, datetime_format)
+        # Verifies that the ISO-8601 formatted time strings
+        # are parsed into numpy datetime64 objects.
+        assert pd.api.types.is_datetime64_dtype(sunrise)
+        assert pd.api.types.is_datetime64_dtype(sunset)
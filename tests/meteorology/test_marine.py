@@ -9,6 +9,9 @@ import pandas as pd
 from .. import utils
 from atmolib import MarineWeather, constants
 
+# Expected index of the resultant marine weather summary objects.
+_SUMMARY_PARAMS = pd.Index(constants.MARINE_WEATHER_SUMMARY_PARAMS)
+
 
 class TestMarineWeather:
     """
@@ -32,23 +35,21 @@ class TestMarineWeather:
         """
         MarineWeather(0, 0, wave_type)
 
-    def test_object_initialization_with_invalid_parameters(self) -> None:
+    @pytest.mark.parametrize("days", (0, -1, 9))
+    def test_object_initialization_with_invalid_forecast_days(self, days: int) -> None:
         """
-        Tests the `MarineWeather` object initialization with invalid parameters.
+        Tests the `MarineWeather` object initialization with invalid forecast days.
         """
 
         with pytest.raises(ValueError):
+            MarineWeather(0, 0, forecast_days=days)
 
-            # Expects a ValueError upon initialization with invalid forecast day.
-            for days in (0, -1, 9):
-                MarineWeather(0, 0, forecast_days=days)
-
-    @pytest.mark.parametrize("wave_type", constants.WAVE_TYPES)
-    def test_marine_weather_summary_methods(self, wave_type: str) -> None:
+    @pytest.mark.remote_data
+    def test_marine_weather_summary_methods(
+        self, marine_weather: MarineWeather
+    ) -> None:
         """Test the marine weather summary extraction methods."""
 
-        marine_weather = MarineWeather(0, 0, wave_type, forecast_days=2)
-
         current = marine_weather.get_current_summary()
         daily = marine_weather.get_daily_summary()
         hourly = marine_weather.get_hourly_summary()
@@ -59,48 +60,48 @@ class TestMarineWeather:
 
         # Verifies the indices and columns of the resultant
         # pandas Series and DataFrame objects.
-        assert current.index.tolist() == constants.MARINE_WEATHER_SUMMARY_PARAMS
-        assert hourly.columns.tolist() == constants.MARINE_WEATHER_SUMMARY_PARAMS
-        assert daily.columns.tolist() == constants.MARINE_WEATHER_SUMMARY_PARAMS
-
-    @pytest.mark.parametrize("wave_type", constants.WAVE_TYPES)
-    def test_wave_height_methods(self, wave_type: str) -> None:
-        """Tests the wave height extraction methods."""
-
-        marine = MarineWeather(0, 0, wave_type, forecast_days=2)
-
-        current = marine.get_current_wave_height()
-        hourly = marine.get_hourly_wave_height()
-        daily = marine.get_daily_max_wave_height()
-
-        assert current is None or current >= 0
-        utils.verify_positive_or_null_data_series(hourly)
-        utils.verify_positive_or_null_data_series(daily)
+        assert current.index.equals(_SUMMARY_PARAMS)
+        assert hourly.columns.equals(_SUMMARY_PARAMS)
+        assert daily.columns.equals(_SUMMARY_PARAMS)
 
-    @pytest.mark.parametrize("wave_type", constants.WAVE_TYPES)
-    def test_wave_direction_methods(self, wave_type: str) -> None:
-        """Tests the wave direction extraction methods."""
-
-        marine = MarineWeather(0, 0, wave_type, forecast_days=2)
-
-        current = marine.get_current_wave_direction()
-        hourly = marine.get_hourly_wave_direction()
-        daily = marine.get_daily_dominant_wave_direction()
-
-        assert current is None or current >= 0
-        utils.verify_positive_or_null_data_series(hourly)
-        utils.verify_positive_or_null_data_series(daily)
-
-    @pytest.mark.parametrize("wave_type", constants.WAVE_TYPES)
-    def test_wave_period_methods(self, wave_type: str) -> None:
-        """Tests the wave period extraction methods."""
-
-        marine = MarineWeather(0, 0, wave_type, forecast_days=2)
-
-        current = marine.get_current_wave_period()
-        hourly = marine.get_hourly_wave_period()
-        daily = marine.get_daily_max_wave_period()
+    @pytest.mark.remote_data
+    def test_wave_methods(self, marine_weather: MarineWeather) -> None:
+        """
+        Tests the wave height, direction and period extraction methods.
+        """
 
-        assert current is None or current >= 0
-        utils.verify_positive_or_null_data_series(hourly)
-        utils.verify_positive_or_null_data_series(daily)
+        (
+            current_height,
+            current_direction,
+            current_period,
+            hourly_height,
+            hourly_direction,
+            hourly_period,
+            daily_height,
+            daily_direction,
+            daily_period,
+        ) = marine_weather.get_many(
+            [
+                marine_weather.get_current_wave_height,
+                marine_weather.get_current_wave_direction,
+                marine_weather.get_current_wave_period,
+                marine_weather.get_hourly_wave_height,
+                marine_weather.get_hourly_wave_direction,
+                marine_weather.get_hourly_wave_period,
+                marine_weather.get_daily_max_wave_height,
+                marine_weather.get_daily_dominant_wave_direction,
+                marine_weather.get_daily_max_wave_period,
+            ]
+        )
+
+        assert current_height is None or current_height >= 0
+        assert current_direction is None or current_direction >= 0
+        assert current_period is None or current_period >= 0
+
+        utils.verify_positive_or_null_data_series(hourly_height)
+        utils.verify_positive_or_null_data_series(hourly_direction)
+        utils.verify_positive_or_null_data_series(hourly_period)
+
+        utils.verify_positive_or_null_data_series(daily_height)
+        utils.verify_positive_or_null_data_series(daily_direction)
+        utils.verify_positive_or_null_data_series(daily_period)
@@ -3,14 +3,50 @@ Tests the classes and methods defined
 within atmolib/meteorology/weather.py.
 """
 
-from datetime import datetime
+import time
 from typing import Any
+from urllib.parse import parse_qsl
+from collections.abc import Iterator
 
 import pytest
+import numpy as np
 import pandas as pd
 
 from .. import utils
-from atmolib import Weather, constants
+from atmolib import Weather, constants, tools
+
+# Exact types of the JSON-decoded current data values for type verification.
+_NUMBER_TYPES = int, float
+
+# Weather codes returned for every metric by the stubbed API responses.
+_STUB_DATA = [0, 3, 99]
+
+
+@pytest.fixture
+def requested_params(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[dict[str, str]]]:
+    """
+    Stubs the API requests with responses comprising the `_STUB_DATA` values
+    for the requested metric, and returns the list of the request parameters
+    mappings requested so far.
+    """
+
+    requested_params: list[dict[str, str]] = []
+
+    def request_json(api: str, params: str, session=None) -> dict:
+        query: dict[str, str] = dict(parse_qsl(params))
+        requested_params.append(query)
+
+        frequency = "hourly" if "hourly" in query else "daily"
+        timeline = ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+        return {frequency: {"time": timeline, query[frequency]: _STUB_DATA}}
+
+    monkeypatch.setattr(tools, "_request_json", request_json)
+    tools.clear_cache()
+
+    yield requested_params
+
+    tools.clear_cache()
 
 
 class TestWeather:
@@ -31,22 +67,74 @@ class TestWeather:
         for days in (1, 10, 16):
             Weather(0, 0, days)
 
-    def test_object_initialization_with_invalid_parameters(
+        # Integral values of other numeric types are also accepted.
+        for days in (np.int64(3), 3.0):
+            Weather(0, 0, days)
+
+    def test_object_initialization_with_invalid_coordinates(
         self, invalid_coordinates: tuple[tuple[float, float], ...]
     ) -> None:
         """
-        Tests the `Weather` object initialization with invalid parameters.
+        Tests the `Weather` object initialization with invalid coordinates.
+        """
+
+        for lat, long in invalid_coordinates:
+            with pytest.raises(ValueError):
+                Weather(lat, long)
+
+    @pytest.mark.parametrize("days", (0, -1, 17, 2.5, "3"))
+    def test_object_initialization_with_invalid_forecast_days(self, days: int) -> None:
+        """
+        Tests the `Weather` object initialization with invalid forecast days.
         """
 
         with pytest.raises(ValueError):
+            Weather(0, 0, days)
 
-            # Expects an ValueError upon initialization with invalid coordinates.
-            for lat, long in invalid_coordinates:
-                Weather(lat, long)
+    def test_methods_with_unhashable_arguments(self, weather: Weather) -> None:
+        """
+        Tests the `Weather` methods with unhashable arguments expecting a ValueError.
+        """
 
-            # Expects an ValueError upon initialization with invalid forecast days.
-            for days in (0, -1, 17):
-                Weather(0, 0, days)
+        with pytest.raises(ValueError):
+            weather.get_hourly_temperature(unit=["celsius"])
+
+        with pytest.raises(ValueError):
+            weather.get_hourly_summary(wind_speed_unit={"kmh"})
+
+    @pytest.mark.remote_data
+    def test_get_many_method(self, weather: Weather) -> None:
+        """Tests the concurrent data extraction method."""
+
+        humidity, temp, precipitation = weather.get_many(
+            [
+                weather.get_hourly_relative_humidity,
+                lambda: weather.get_hourly_temperature(unit="fahrenheit"),
+                lambda: weather.get_hourly_precipitation(unit="inch"),
+            ]
+        )
+
+        utils.verify_positive_range_data_series(humidity, 100)
+        utils.verify_temperature_data_series(temp)
+        utils.verify_positive_data_series(precipitation)
+
+    def test_get_many_method_with_plain_callables(self, weather: Weather) -> None:
+        """
+        Tests the concurrent data extraction method with plain callables
+        expecting the results in the order in which the calls were specified.
+        """
+
+        # The first call completes last, verifying the results are
+        # ordered by the calls instead of their completion.
+        results = weather.get_many([lambda: time.sleep(0.05) or 1, lambda: 2])
+        assert results == [1, 2]
+
+        def fail() -> None:
+            raise ValueError("extraction failed")
+
+        # Expects the exception raised within a call to be propagated.
+        with pytest.raises(ValueError, match="extraction failed"):
+            weather.get_many([lambda: 1, fail])
 
     # The following block comprises test verification methods.
 
@@ -70,6 +158,7 @@ class TestWeather:
 
     # The following block tests summary data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
     def test_summary_methods_with_temperature_units(
         self, weather: Weather, unit: str
@@ -80,6 +169,7 @@ class TestWeather:
         """
         self._verify_summary_methods(weather, {"temperature_unit": unit})
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.PRECIPITATION_UNITS)
     def test_summary_methods_with_precipitation_units(
         self, weather: Weather, unit: str
@@ -90,6 +180,7 @@ class TestWeather:
         """
         self._verify_summary_methods(weather, {"precipitation_unit": unit})
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
     def test_summary_methods_with_wind_speed_units(
         self, weather: Weather, unit: str
@@ -102,6 +193,7 @@ class TestWeather:
 
     # The following block tests temperature data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
     def test_temperature_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -115,11 +207,12 @@ class TestWeather:
         daily = weather.get_daily_temperature(unit=unit)
         hourly = weather.get_hourly_temperature(unit=unit)
 
-        assert isinstance(current, int | float)
+        assert type(current) in _NUMBER_TYPES
 
         utils.verify_temperature_data_series(daily)
         utils.verify_temperature_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("altitude", constants.TEMPERATURE_ALTITUDES)
     def test_temperature_methods_with_different_altitudes(
         self, weather: Weather, altitude: int
@@ -132,9 +225,10 @@ class TestWeather:
         current = weather.get_current_temperature(altitude=altitude)
         hourly = weather.get_hourly_temperature(altitude=altitude)
 
-        assert isinstance(current, int | float)
+        assert type(current) in _NUMBER_TYPES
         utils.verify_temperature_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
     def test_apparent_temperature_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -148,11 +242,12 @@ class TestWeather:
         daily = weather.get_daily_apparent_temperature(unit=unit)
         hourly = weather.get_hourly_apparent_temperature(unit=unit)
 
-        assert isinstance(current, int | float)
+        assert type(current) in _NUMBER_TYPES
 
         utils.verify_temperature_data_series(daily)
         utils.verify_temperature_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("metric", constants.DAILY_WEATHER_STATISTICAL_METRICS)
     def test_daily_temperature_methods_with_different_metrics(
         self, weather: Weather, metric: str
@@ -168,6 +263,7 @@ class TestWeather:
         utils.verify_temperature_data_series(temp)
         utils.verify_temperature_data_series(apparent_temp)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.TEMPERATURE_UNITS)
     def test_soil_temperature_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -180,6 +276,7 @@ class TestWeather:
         hourly = weather.get_hourly_soil_temperature(unit=unit)
         utils.verify_temperature_data_series(hourly)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("depth", constants.SOIL_TEMP_DEPTH)
     def test_soil_temperature_methods_with_different_depths(
         self, weather: Weather, depth: int
@@ -194,6 +291,7 @@ class TestWeather:
 
     # The following block tests precipitation data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.PRECIPITATION_UNITS)
     def test_precipitation_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -211,6 +309,7 @@ class TestWeather:
         utils.verify_positive_data_series(hourly)
         utils.verify_positive_data_series(daily)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.PRECIPITATION_UNITS)
     def test_rainfall_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -228,6 +327,18 @@ class TestWeather:
         utils.verify_positive_data_series(hourly)
         utils.verify_positive_data_series(daily)
 
+    def test_hourly_snowfall_method_request_parameters(
+        self, weather: Weather, requested_params: list[dict[str, str]]
+    ) -> None:
+        """
+        Tests the hourly snowfall extraction method with a stubbed
+        API response expecting the snowfall metric to be requested.
+        """
+
+        weather.get_hourly_snowfall()
+        assert requested_params[-1]["hourly"] == "snowfall"
+
+    @pytest.mark.remote_data
     def test_precipitation_probability_methods(self, weather: Weather) -> None:
         """Tests the precipitation probability extraction methods"""
 
@@ -239,6 +350,7 @@ class TestWeather:
 
     # The following block tests cloud coverage data extraction methods.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("level", constants.CLOUD_COVER_LEVELS)
     def test_cloud_cover_methods_level_parameter(
         self, weather: Weather, level: str
@@ -253,6 +365,7 @@ class TestWeather:
         assert 0 <= current <= 100
         utils.verify_positive_range_data_series(hourly, 100)
 
+    @pytest.mark.remote_data
     def test_total_cloud_cover_methods(self, weather: Weather) -> None:
         """
         Test the total cloud cover extraction
@@ -267,6 +380,27 @@ class TestWeather:
 
     # The following block tests wind data extraction methods.
 
+    @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
+    def test_daily_wind_methods_request_parameters(
+        self, weather: Weather, requested_params: list[dict[str, str]], unit: str
+    ) -> None:
+        """
+        Tests the daily maximum wind speed and wind gusts extraction methods with
+        stubbed API responses expecting the wind speed unit to be requested.
+        """
+
+        weather.get_daily_max_wind_speed(unit=unit)
+        weather.get_daily_max_wind_gusts(unit=unit)
+
+        speed, gusts = requested_params
+
+        assert speed["daily"] == "wind_speed_10m_max"
+        assert gusts["daily"] == "wind_gusts_10m_max"
+
+        assert speed["wind_speed_unit"] == unit
+        assert gusts["wind_speed_unit"] == unit
+
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
     def test_wind_speed_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -284,6 +418,7 @@ class TestWeather:
         utils.verify_positive_data_series(hourly)
         utils.verify_positive_data_series(daily)
 
+    @pytest.mark.remote_data
     def test_wind_direction_methods(self, weather: Weather) -> None:
         """Tests wind direction extraction methods."""
 
@@ -296,6 +431,7 @@ class TestWeather:
         utils.verify_positive_range_data_series(hourly, 360)
         utils.verify_positive_range_data_series(daily, 360)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("unit", constants.WIND_SPEED_UNITS)
     def test_winds_gust_methods_with_different_units(
         self, weather: Weather, unit: str
@@ -315,6 +451,7 @@ class TestWeather:
 
     # The following block tests weather code extraction methods.
 
+    @pytest.mark.remote_data
     def test_current_weather_code_method(self, weather: Weather) -> None:
         """Tests the current weather code extraction method."""
 
@@ -324,6 +461,7 @@ class TestWeather:
         assert str(code[0]) in constants.WEATHER_CODES
         assert code[1] in constants.WEATHER_CODES.values()
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("frequency", constants.FREQUENCIES)
     def test_periodical_weather_code_method(
         self, weather: Weather, frequency: str
@@ -332,18 +470,39 @@ class TestWeather:
 
         code = weather.get_periodical_weather_code(frequency)
 
-        # Converts the values stored in the 'data' column into strings to verify
-        # them with the keys of the `atmolib.constants.WEATHER_CODES` dictionary.
-        code["data"] = code["data"].astype(str)
-
         assert isinstance(code, pd.DataFrame)
 
-        assert code["data"].isin(constants.WEATHER_CODES).all()
+        # Verifies the integer weather codes directly against the integer keys
+        # of `constants.WEATHER_CODE_DESCRIPTIONS` without any string casting.
+        assert code["data"].isin(constants.WEATHER_CODE_DESCRIPTIONS).all()
         assert code["description"].isin(constants.WEATHER_CODES.values()).all()
 
+    @pytest.mark.parametrize("frequency", constants.FREQUENCIES)
+    def test_periodical_weather_code_method_descriptions(
+        self,
+        weather: Weather,
+        requested_params: list[dict[str, str]],
+        frequency: str,
+    ) -> None:
+        """
+        Tests the periodical weather code extraction method with a stubbed
+        API response expecting the descriptions of the known weather codes.
+        """
+
+        code = weather.get_periodical_weather_code(frequency)
+
+        assert requested_params[-1][frequency] == "weather_code"
+        assert code["data"].tolist() == _STUB_DATA
+        assert code["description"].tolist() == [
+            "Clear Sky",
+            "Overcast",
+            "Heavy Hail Thunderstorm",
+        ]
+
     # All other types of weather data extraction
     # methods are tested in the following block.
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("level", constants.PRESSURE_LEVELS)
     def test_atmospheric_pressure_extraction_methods(
         self, weather: Weather, level: str
@@ -359,6 +518,7 @@ class TestWeather:
         assert current >= 0
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_relative_humidity_methods(self, weather: Weather) -> None:
         """Tests the relative humidity extraction methods."""
 
@@ -368,6 +528,7 @@ class TestWeather:
         assert 0 <= current <= 100
         utils.verify_positive_range_data_series(hourly, 100)
 
+    @pytest.mark.remote_data
     @pytest.mark.parametrize("depth", (0, 10, 18, 78, 81))
     def test_soil_moisture_methods(self, weather: Weather, depth: int) -> None:
         """Tests the soil moisture extraction methods."""
@@ -375,29 +536,33 @@ class TestWeather:
         moisture = weather.get_hourly_soil_moisture(depth=depth)
         utils.verify_positive_data_series(moisture)
 
+    @pytest.mark.remote_data
     def test_daily_max_uv_index_method(self, weather: Weather) -> None:
         """Tests the `Weather.get_daily_max_uv_index` method."""
 
         uv = weather.get_daily_max_uv_index()
         utils.verify_positive_data_series(uv)
 
+    @pytest.mark.remote_data
     def test_is_day_or_night_method(self, weather: Weather) -> None:
         """Test the `Weather.is_day_or_night` method."""
 
         is_day_or_night = weather.is_day_or_night()
         assert is_day_or_night in (1, 0)
 
+    @pytest.mark.remote_data
     def test_visibility_methods(self, weather: Weather) -> None:
         """Tests the visibility extraction methods."""
 
         current = weather.get_current_visibility()
         hourly = weather.get_hourly_visibility()
 
-        assert isinstance(current, int | float)
+        assert type(current) in _NUMBER_TYPES
         assert current >= 0
 
         utils.verify_positive_data_series(hourly)
 
+    @pytest.mark.remote_data
     def test_daylight_and_sunlight_duration_methods(self, weather: Weather) -> None:
         """Test the daily daylight and sunshine duration extraction methods."""
 
@@ -407,18 +572,17 @@ class TestWeather:
         utils.verify_positive_range_data_series(daylight, 86_400)
         utils.verify_positive_range_data_series(sunshine, 86_400)
 
+    @pytest.mark.remote_data
     def test_sunrise_and_sunset_time_methods(self, weather: Weather) -> None:
         """Tests the daily sunrise and sunset time extraction methods."""
 
         sunrise = weather.get_daily_sunrise_time()
         sunset = weather.get_daily_sunset_time()
 
-        datetime_format = r"%Y-%m-%dT%H:%M"
-
         assert isinstance(sunrise, pd.Series)
         assert isinstance(sunset, pd.Series)
 
-        # Iterates through the pandas Series objects and
-        # verifies the datetime format at each iteration.
-        for time in pd.concat([sunrise, sunset], ignore_index=True):
-            datetime.strptime(time, datetime_format)
+        # Verifies that the ISO-8601 formatted time strings
+        # are parsed into numpy datetime64 objects.
+        assert pd.api.types.is_datetime64_dtype(sunrise)
+        assert pd.api.types.is_datetime64_dtype(sunset)
@@ -2,10 +2,17 @@
 Tests the public functions defined within atmolib/common/tools.py.
 """
 
+from datetime import date
+from urllib.parse import unquote
+from collections.abc import Iterator
+
 import pytest
-from atmolib import tools
+import requests
+
+from atmolib import tools, constants
 
 
+@pytest.mark.remote_data
 def test_get_elevation_function_with_valid_coordinates(
     valid_coordinates: tuple[tuple[float, float], ...]
 ) -> None:
@@ -31,6 +38,7 @@ def test_get_elevation_function_with_invalid_coordinates(
             tools.get_elevation(lat, long)
 
 
+@pytest.mark.remote_data
 def test_city_details_function(cities: tuple[str, ...]) -> None:
     """
     Tests the `tools.get_city_details` function with different city names.
@@ -53,3 +61,161 @@ def test_city_details_function_with_invalid_count(
         # Expects a ValueError with invalid city count arguments.
         for count in invalid_city_counts:
             tools.get_city_details("delhi", count)
+
+
+def test_encode_params_function() -> None:
+    """
+    Tests the `tools._encode_params` function expecting the query string
+    assembled by `requests` for the same parameters without percent-encoding.
+    """
+
+    params = {
+        "latitude": 49.1,
+        "longitude": -39.55,
+        "start_date": date(2020, 1, 1),
+        "end_date": date(2020, 1, 10),
+        "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m",
+        "forecast_days": 2,
+    }
+
+    query: str = tools._encode_params(params)
+
+    assert query == (
+        "latitude=49.1&longitude=-39.55&start_date=2020-01-01&end_date=2020-01-10"
+        "&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m&forecast_days=2"
+    )
+
+    # `requests` percent-encodes the commas in the metric lists, which the
+    # API decodes back, hence the query strings are compared once decoded.
+    prepared = requests.Request("GET", constants.WEATHER_API, params=params).prepare()
+    assert unquote(prepared.url.partition("?")[2]) == query
+
+
+class _Clock:
+    """Monotonic clock stub advanced manually by the tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def requests_made(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    """
+    Stubs the API requests made by the response cache with a static hourly
+    response, and returns the list of the query strings requested so far.
+    """
+
+    requests_made: list[str] = []
+
+    def request_json(api: str, params: str, session=None) -> dict:
+        requests_made.append(params)
+        return {"hourly": {"time": ["T00:00", "T01:00"], "temperature_2m": [1, 2]}}
+
+    monkeypatch.setattr(tools, "_request_json", request_json)
+    tools.clear_cache()
+
+    yield requests_made
+
+    tools.clear_cache()
+    tools.enable_cache()
+
+
+def _get_temperature(latitude: int = 0) -> None:
+    """Requests hourly temperature data at the specified latitude."""
+
+    params = {"latitude": latitude, "longitude": 0, "hourly": "temperature_2m"}
+    tools.get_periodical_data(None, constants.WEATHER_API, params)
+
+
+def test_response_cache_with_repeated_requests(requests_made: list[str]) -> None:
+    """
+    Tests the response cache expecting a single API request for repeated calls.
+    """
+
+    _get_temperature()
+    _get_temperature()
+
+    assert len(requests_made) == 1
+
+
+def test_response_cache_expiry(
+    requests_made: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests the response cache expecting an API request once the cached response expires.
+    """
+
+    clock = _Clock()
+    monkeypatch.setattr(tools, "time", clock)
+
+    _get_temperature()
+
+    clock.now = constants.RESPONSE_CACHE_TTL - 1
+    _get_temperature()
+    assert len(requests_made) == 1
+
+    clock.now = constants.RESPONSE_CACHE_TTL
+    _get_temperature()
+    assert len(requests_made) == 2
+
+
+def test_response_cache_eviction(requests_made: list[str]) -> None:
+    """
+    Tests the response cache expecting the least recently
+    used response to be evicted once the cache is full.
+    """
+
+    for latitude in range(constants.RESPONSE_CACHE_SIZE):
+        _get_temperature(latitude)
+
+    # Marks the first response as the most recently used,
+    # leaving the second one to be evicted upon the next request.
+    _get_temperature(0)
+    _get_temperature(-1)
+
+    count = len(requests_made)
+    assert count == constants.RESPONSE_CACHE_SIZE + 1
+
+    _get_temperature(0)
+    assert len(requests_made) == count
+
+    _get_temperature(1)
+    assert len(requests_made) == count + 1
+
+
+def test_response_cache_eviction_by_data_values(
+    requests_made: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests the response cache expecting the least recently used responses to be
+    evicted once the data values within the cached responses exceed the limit.
+    """
+
+    # Each response comprises 4 data values, allowing only 2 cached responses.
+    monkeypatch.setattr(constants, "RESPONSE_CACHE_MAX_VALUES", 8)
+
+    for latitude in range(3):
+        _get_temperature(latitude)
+
+    _get_temperature(2)
+    _get_temperature(1)
+    assert len(requests_made) == 3
+
+    _get_temperature(0)
+    assert len(requests_made) == 4
+
+
+def test_disabled_response_cache(requests_made: list[str]) -> None:
+    """
+    Tests the response cache expecting an API request for every call once disabled.
+    """
+
+    tools.disable_cache()
+
+    _get_temperature()
+    _get_temperature()
+
+    assert len(requests_made) == 2
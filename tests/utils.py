@@ -9,42 +9,57 @@ to support test functions and methods defined within the project.
 import numpy as np
 import pandas as pd
 
+# Numeric scalar types of the pandas Series data for dtype verification.
+_NUMERIC_TYPES = np.integer, np.floating
 
-def verify_positive_data_series(series: pd.Series) -> None:
+# The optional `label` parameter of the following functions is used as the
+# assertion message for identifying the verified data series upon failure.
+
+
+def verify_positive_data_series(series: pd.Series, label: str | None = None) -> None:
     """
     Verifies that all the values stored within the
     specified pandas Series object are greater than 0.
     """
 
-    assert isinstance(series, pd.Series)
-    assert (series >= 0).all()
+    assert isinstance(series, pd.Series), label
+    assert (series.to_numpy() >= 0).all(), label
 
 
-def verify_positive_or_null_data_series(series: pd.Series) -> None:
+def verify_positive_or_null_data_series(
+    series: pd.Series, label: str | None = None
+) -> None:
     """
     Verifies that all the values stored within the specified
     pandas Series object are either positive integers or None.
     """
 
-    assert isinstance(series, pd.Series)
-    assert ((series >= 0) | series.isna()).all()
+    assert isinstance(series, pd.Series), label
 
+    # Null values compare false with any number, hence
+    # are never counted among the negative values.
+    assert not (series.to_numpy() < 0).any(), label
 
-def verify_temperature_data_series(series: pd.Series) -> None:
+
+def verify_temperature_data_series(series: pd.Series, label: str | None = None) -> None:
     """
     Verifies the temperature data stored within
     the specified pandas Series object.
     """
 
-    assert isinstance(series, pd.Series)
-    assert issubclass(series.dtype.type, np.integer | np.floating)
+    assert isinstance(series, pd.Series), label
+    assert issubclass(series.dtype.type, _NUMERIC_TYPES), label
 
 
-def verify_positive_range_data_series(series: pd.Series, end: int) -> None:
+def verify_positive_range_data_series(
+    series: pd.Series, end: int, label: str | None = None
+) -> None:
     """
     Verifies that all the values stored within the specified pandas
     Series object are greater than 0 and less than the specified end.
     """
 
-    verify_positive_data_series(series)
-    assert (series <= end).all()
+    assert isinstance(series, pd.Series), label
+
+    values: np.ndarray = series.to_numpy()
+    assert ((values >= 0) & (values <= end)).all(), label